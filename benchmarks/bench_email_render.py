@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import datetime as dt
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from email import policy  # noqa: E402
+from email.message import EmailMessage  # noqa: E402
+
+from emailer import (  # noqa: E402
+    WARSAW_TZ,
+    build_email_body,
+    build_message_bytes,
+    clear_render_cache,
+)
+from response_models import Address, AddressTeryt, OutageRecord  # noqa: E402
+
+
+NOTIFICATIONS = int(os.getenv("BENCH_NOTIFICATIONS", "10000"))
+ADDRESSES = 300
+SUBJECT = "Powiadomienie o wylaczeniu pradu"
+SENDER = "alerts@example.com"
+
+
+def _build_record() -> OutageRecord:
+    addresses = [
+        Address(
+            numbers=f"{idx}, {idx + 1}A, {idx + 2}/4",
+            teryt=AddressTeryt(street_name=f"Ulica Żółtkowa {idx}"),
+        )
+        for idx in range(ADDRESSES)
+    ]
+    return OutageRecord(
+        description="Planowane prace sieciowe na linii średniego napięcia.",
+        start_at="2026-10-20 08:00:00",
+        stop_at="2026-10-20 16:00:00",
+        revoked=False,
+        revoked_description=None,
+        addresses=addresses,
+    )
+
+
+def _legacy_format_remaining(now: dt.datetime, start_at: str) -> str:
+    start_dt = dt.datetime.strptime(start_at, "%Y-%m-%d %H:%M:%S").replace(tzinfo=WARSAW_TZ)
+    delta = start_dt - now if now < start_dt else dt.timedelta(0)
+    total_minutes = int(delta.total_seconds() // 60)
+    days = total_minutes // (24 * 60)
+    hours = (total_minutes % (24 * 60)) // 60
+    minutes = total_minutes % 60
+    if days > 0:
+        return f"dni: {days}, godzin: {hours}, minut: {minutes}"
+    return f"godzin: {hours}, minut: {minutes}"
+
+
+def _legacy_format_addresses(addresses: list[Address]) -> str:
+    if not addresses:
+        return "Brak adresow"
+    lines: list[str] = []
+    for idx, address in enumerate(addresses, start=1):
+        street_name = None
+        if address.teryt is not None:
+            street_name = address.teryt.street_name
+        street_label = street_name or "(brak)"
+        numbers = address.numbers or "(brak)"
+        lines.append(f"{idx}) Ulica: {street_label}, numery: {numbers}")
+    return "\n".join(lines)
+
+
+def _legacy_render(
+    now: dt.datetime,
+    record: OutageRecord,
+    city_name: str,
+    street_name: str,
+    recipient: str,
+) -> bytes:
+    remaining = _legacy_format_remaining(now, record.start_at)
+    addresses = _legacy_format_addresses(record.addresses)
+    revoked_label = "Tak" if record.revoked else "Nie"
+    revoked_description = record.revoked_description or "(brak)"
+    body = (
+        "Cześć,\n\n"
+        f"Zbliża się wyłączenie planowe prądu dla {city_name} na Twojej ulicy: {street_name}.\n"
+        f"Nastąpi ono od {record.start_at} do {record.stop_at}.\n"
+        f"POZOSTAŁY CZAS: {remaining}.\n\n"
+        "Szczegóły przerwy:\n"
+        f"Opis: {record.description}\n"
+        f"Odwołane: {revoked_label}\n"
+        f"Opis odwołania: {revoked_description}\n"
+        "Adresy:\n"
+        f"{addresses}\n\n"
+        "Pozdro,\n"
+        "Admin\n"
+    )
+    message = EmailMessage()
+    message["Subject"] = SUBJECT
+    message["From"] = SENDER
+    message["To"] = recipient
+    message.set_content(body, subtype="plain", charset="utf-8")
+    return message.as_bytes(policy=policy.SMTP)
+
+
+def _cached_render(
+    now: dt.datetime,
+    record: OutageRecord,
+    city_name: str,
+    street_name: str,
+    recipient: str,
+) -> bytes:
+    body = build_email_body(now, record, city_name, street_name)
+    return build_message_bytes(
+        subject=SUBJECT,
+        sender=SENDER,
+        recipients=[recipient],
+        body=body,
+    )
+
+
+def _render_all(record: OutageRecord, now: dt.datetime, render) -> float:
+    started = time.perf_counter()
+    for idx in range(NOTIFICATIONS):
+        render(
+            now,
+            record,
+            "Białystok",
+            f"Ulica Żółtkowa {idx % ADDRESSES}",
+            f"user{idx}@example.com",
+        )
+    return time.perf_counter() - started
+
+
+def main() -> None:
+    record = _build_record()
+    now = dt.datetime(2026, 10, 19, 21, 0, tzinfo=WARSAW_TZ)
+
+    clear_render_cache()
+    legacy = _render_all(record, now, _legacy_render)
+    cached = _render_all(record, now, _cached_render)
+
+    print(f"notifications={NOTIFICATIONS} addresses_per_record={ADDRESSES}")
+    print(f"legacy: {legacy:.3f}s ({legacy / NOTIFICATIONS * 1e6:.1f} us/notification)")
+    print(f"cached: {cached:.3f}s ({cached / NOTIFICATIONS * 1e6:.1f} us/notification)")
+    print(f"speedup: {legacy / cached:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
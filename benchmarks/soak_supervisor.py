@@ -0,0 +1,389 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import contextlib
+import datetime as dt
+import json
+import os
+import socketserver
+import statistics
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from app import WARSAW_TZ, run_supervisor  # noqa: E402
+from config import AppConfig, parse_hours  # noqa: E402
+
+
+STREET_NAME = "Zdrojowa"
+SAMPLE_EVERY = dt.timedelta(days=1)
+
+Slot = Tuple[dt.date, int]
+
+
+@dataclass
+class MemorySample:
+    simulated_at: dt.datetime
+    traced_bytes: int
+    rss_bytes: Optional[int]
+
+
+@dataclass
+class VirtualClock:
+    start: dt.datetime
+    end: dt.datetime
+    waits: int = 0
+    cycle_seconds: List[float] = field(default_factory=list)
+    samples: List[MemorySample] = field(default_factory=list)
+    _instant: dt.datetime = field(init=False)
+    _cycle_started: Optional[float] = field(init=False, default=None)
+    _next_sample: dt.datetime = field(init=False)
+
+    def __post_init__(self) -> None:
+        self._instant = self.start.astimezone(dt.timezone.utc)
+        self._next_sample = self._instant
+
+    def now(self) -> dt.datetime:
+        return self._instant.astimezone(WARSAW_TZ)
+
+    async def wait(self, stop: asyncio.Event, seconds: float) -> None:
+        if self._cycle_started is not None:
+            self.cycle_seconds.append(time.perf_counter() - self._cycle_started)
+        self.waits += 1
+        if self._instant >= self._next_sample:
+            self.samples.append(
+                MemorySample(
+                    simulated_at=self.now(),
+                    traced_bytes=_traced_app_bytes(),
+                    rss_bytes=_read_rss_bytes(),
+                )
+            )
+            self._next_sample += SAMPLE_EVERY
+        next_instant = self._instant + dt.timedelta(seconds=seconds)
+        if next_instant >= self.end:
+            stop.set()
+        else:
+            self._instant = next_instant
+        await asyncio.sleep(0)
+        self._cycle_started = time.perf_counter()
+
+
+def _traced_app_bytes() -> int:
+    snapshot = tracemalloc.take_snapshot().filter_traces(
+        [
+            tracemalloc.Filter(False, __file__),
+            tracemalloc.Filter(False, tracemalloc.__file__),
+        ]
+    )
+    return sum(stat.size for stat in snapshot.statistics("filename"))
+
+
+def _read_rss_bytes() -> Optional[int]:
+    try:
+        with open("/proc/self/statm", encoding="ascii") as handle:
+            resident_pages = int(handle.read().split()[1])
+    except (OSError, IndexError, ValueError):
+        return None
+    return resident_pages * os.sysconf("SC_PAGE_SIZE")
+
+
+def _build_payload(now: dt.datetime, addresses: int) -> List[dict[str, Any]]:
+    start_at = now + dt.timedelta(days=1)
+    stop_at = start_at + dt.timedelta(hours=8)
+    return [
+        {
+            "description": f"Prace sieciowe, ul. {STREET_NAME}",
+            "startAt": start_at.strftime("%Y-%m-%d %H:%M:%S"),
+            "stopAt": stop_at.strftime("%Y-%m-%d %H:%M:%S"),
+            "revoked": False,
+            "revokedDescription": None,
+            "addresses": [
+                {"numbers": f"{idx}, {idx + 1}A", "teryt": {"streetName": STREET_NAME}}
+                for idx in range(addresses)
+            ],
+        }
+    ]
+
+
+class _ApiHandler(BaseHTTPRequestHandler):
+    server: "StandInApi"
+
+    def do_GET(self) -> None:  # noqa: N802 - http.server naming
+        query = parse_qs(urlsplit(self.path).query)
+        stop_at_from = query.get("stopAtFrom", [""])[0]
+        requested_at = dt.datetime.strptime(stop_at_from, "%Y-%m-%d %H:%M:%S")
+        self.server.record_call(requested_at)
+
+        body = json.dumps(
+            _build_payload(requested_at, self.server.addresses),
+            ensure_ascii=False,
+        ).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        return
+
+
+class StandInApi(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, addresses: int) -> None:
+        super().__init__(("127.0.0.1", 0), _ApiHandler)
+        self.addresses = addresses
+        self.calls: List[dt.datetime] = []
+        self._lock = threading.Lock()
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}/api/power-outage"
+
+    def record_call(self, requested_at: dt.datetime) -> None:
+        with self._lock:
+            self.calls.append(requested_at)
+
+
+class _SmtpHandler(socketserver.StreamRequestHandler):
+    server: "StandInSmtp"
+
+    def _reply(self, line: str) -> None:
+        self.wfile.write(line.encode("ascii") + b"\r\n")
+
+    def _read_data(self) -> bytes:
+        chunks: List[bytes] = []
+        while True:
+            line = self.rfile.readline()
+            if not line or line == b".\r\n":
+                return b"".join(chunks)
+            chunks.append(line)
+
+    def handle(self) -> None:
+        self._reply("220 soak ESMTP")
+        while True:
+            line = self.rfile.readline()
+            if not line:
+                return
+            verb = line.decode("ascii", "replace").strip().split(" ", 1)[0].upper()
+            if verb == "EHLO":
+                self._reply("250-soak")
+                self._reply("250-AUTH PLAIN")
+                self._reply("250 8BITMIME")
+            elif verb == "AUTH":
+                self._reply("235 Authentication succeeded")
+            elif verb in {"HELO", "MAIL", "RCPT", "RSET", "NOOP"}:
+                self._reply("250 OK")
+            elif verb == "DATA":
+                self._reply("354 End data with <CR><LF>.<CR><LF>")
+                self.server.record_message(self._read_data())
+                self._reply("250 OK")
+            elif verb == "QUIT":
+                self._reply("221 Bye")
+                return
+            else:
+                self._reply("502 Command not implemented")
+
+
+class StandInSmtp(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self) -> None:
+        super().__init__(("127.0.0.1", 0), _SmtpHandler)
+        self.messages = 0
+        self.message_bytes = 0
+        self._lock = threading.Lock()
+
+    @property
+    def port(self) -> int:
+        return self.server_address[1]
+
+    def record_message(self, data: bytes) -> None:
+        with self._lock:
+            self.messages += 1
+            self.message_bytes += len(data)
+
+
+def expected_slots(
+    start: dt.datetime,
+    end: dt.datetime,
+    hours: List[int],
+) -> Tuple[set[Slot], set[Slot]]:
+    expected: set[Slot] = set()
+    instant = start.astimezone(dt.timezone.utc)
+    stop = end.astimezone(dt.timezone.utc)
+    while instant < stop:
+        local = instant.astimezone(WARSAW_TZ)
+        if local.hour in hours:
+            expected.add((local.date(), local.hour))
+        instant += dt.timedelta(hours=1)
+
+    nonexistent: set[Slot] = set()
+    day = start.date()
+    while day < end.date():
+        for hour in hours:
+            if (day, hour) not in expected:
+                nonexistent.add((day, hour))
+        day += dt.timedelta(days=1)
+    return expected, nonexistent
+
+
+def _percentile(values: List[float], fraction: float) -> float:
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def _format_bytes(value: Optional[int]) -> str:
+    if value is None:
+        return "n/a"
+    return f"{value / 1024:.1f} KiB"
+
+
+def _dir_stats(path: str) -> Tuple[int, int]:
+    files = 0
+    total = 0
+    for name in os.listdir(path):
+        files += 1
+        total += os.path.getsize(os.path.join(path, name))
+    return files, total
+
+
+def _build_config(args: argparse.Namespace, api: StandInApi, smtp: StandInSmtp) -> AppConfig:
+    return AppConfig(
+        hours=parse_hours(args.hours),
+        city_sym="0031377",
+        city_name="Białystok",
+        poll_interval_seconds=args.poll_interval,
+        timeout_seconds=10,
+        interval_days=3,
+        street_name=STREET_NAME,
+        smtp_host="127.0.0.1",
+        smtp_port=smtp.port,
+        smtp_user="soak",
+        smtp_password="soak",
+        smtp_from="soak@example.com",
+        smtp_to=["subscriber@example.com"],
+        smtp_use_tls=False,
+        api_base_url=api.url,
+        health_port=0,
+    )
+
+
+def run_soak(args: argparse.Namespace) -> None:
+    start = dt.datetime.combine(args.start, dt.time(0, 0), tzinfo=WARSAW_TZ)
+    end = start + dt.timedelta(days=args.days)
+    clock = VirtualClock(start=start, end=end)
+
+    api = StandInApi(args.addresses)
+    smtp = StandInSmtp()
+    for server in (api, smtp):
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    config = _build_config(args, api, smtp)
+    tracemalloc.start()
+    wall_started = time.perf_counter()
+    with tempfile.TemporaryDirectory() as log_dir:
+        with open(os.devnull, "w", encoding="utf-8") as devnull:
+            with contextlib.redirect_stdout(devnull):
+                exit_code = asyncio.run(
+                    run_supervisor(
+                        config=config,
+                        now_fn=clock.now,
+                        wait_fn=clock.wait,
+                        log_dir=log_dir,
+                    )
+                )
+        log_files, log_bytes = _dir_stats(log_dir)
+    wall_seconds = time.perf_counter() - wall_started
+    tracemalloc.stop()
+
+    api.shutdown()
+    smtp.shutdown()
+
+    expected, nonexistent = expected_slots(start, end, config.hours)
+    observed = Counter((call.date(), call.hour) for call in api.calls)
+    missed = sorted(expected - set(observed))
+    duplicates = sorted(slot for slot, count in observed.items() if count > 1)
+    unexpected = sorted(set(observed) - expected)
+
+    print(f"simulated: {start.isoformat()} -> {end.isoformat()} ({args.days} days)")
+    print(
+        f"wall time: {wall_seconds:.2f}s, loop cycles: {clock.waits}, "
+        f"supervisor exit code: {exit_code}"
+    )
+    print(f"api calls: {len(api.calls)}, emails: {smtp.messages} ({smtp.message_bytes} bytes)")
+    print(
+        f"slots: expected={len(expected)} missed={len(missed)} "
+        f"duplicate={len(duplicates)} unexpected={len(unexpected)}"
+    )
+    for label, slots in (
+        ("missed", missed),
+        ("duplicate", duplicates),
+        ("unexpected", unexpected),
+        ("nonexistent (DST)", sorted(nonexistent)),
+    ):
+        for day, hour in slots:
+            print(f"  {label}: {day.isoformat()} {hour:02d}:00 x{observed.get((day, hour), 0)}")
+
+    if clock.cycle_seconds:
+        cycles_ms = [value * 1000 for value in clock.cycle_seconds]
+        print(
+            "cycle latency ms: "
+            f"p50={_percentile(cycles_ms, 0.5):.3f} "
+            f"p95={_percentile(cycles_ms, 0.95):.3f} "
+            f"p99={_percentile(cycles_ms, 0.99):.3f} "
+            f"max={max(cycles_ms):.3f} "
+            f"mean={statistics.fmean(cycles_ms):.3f}"
+        )
+
+    print(f"log files: {log_files} ({_format_bytes(log_bytes)})")
+    if clock.samples:
+        first = clock.samples[0]
+        last = clock.samples[-1]
+        print(
+            "tracemalloc: "
+            f"start={_format_bytes(first.traced_bytes)} end={_format_bytes(last.traced_bytes)} "
+            f"growth={_format_bytes(last.traced_bytes - first.traced_bytes)}"
+        )
+        rss_growth = None
+        if first.rss_bytes is not None and last.rss_bytes is not None:
+            rss_growth = last.rss_bytes - first.rss_bytes
+        print(
+            "rss: "
+            f"start={_format_bytes(first.rss_bytes)} end={_format_bytes(last.rss_bytes)} "
+            f"growth={_format_bytes(rss_growth)}"
+        )
+        for sample in clock.samples:
+            print(
+                f"  {sample.simulated_at.strftime('%Y-%m-%d %H:%M %Z')} "
+                f"traced={_format_bytes(sample.traced_bytes)} rss={_format_bytes(sample.rss_bytes)}"
+            )
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Drive the supervisor through simulated time against local API/SMTP stand-ins.",
+    )
+    parser.add_argument("--start", type=dt.date.fromisoformat, default=dt.date(2026, 3, 23))
+    parser.add_argument("--days", type=int, default=14)
+    parser.add_argument("--hours", default="2,9,21")
+    parser.add_argument("--poll-interval", type=int, default=30)
+    parser.add_argument("--addresses", type=int, default=50)
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    run_soak(_parse_args())
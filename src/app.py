@@ -1,15 +1,22 @@
 from __future__ import annotations
 
+import asyncio
 import datetime as dt
-import time
+import os
+import signal
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, Optional
 from zoneinfo import ZoneInfo
 
 import requests
 
-from config import AppConfig, load_config
+from config import AppConfig, ConfigWatcher, changed_fields
 from http_client import send_request
 from log_writer import write_log, write_message
-from emailer import build_email_body, send_email
+from emailer import SMTP_TIMEOUT_SECONDS, build_email_body, send_email
+from health import HealthServer, HealthState
 from response_models import OutageRecord, parse_outage_response
 
 
@@ -23,13 +30,14 @@ def _send_req_and_email(
     session: requests.Session,
     now: dt.datetime,
     log_dir: str,
-) -> None:
+) -> bool:
     result = send_request(
         session=session,
         now=now,
         city_sym=config.city_sym,
         interval_days=config.interval_days,
         timeout_seconds=config.timeout_seconds,
+        base_url=config.api_base_url,
     )
     write_log(result, log_dir)
     formatted_response: list[OutageRecord] | None = None
@@ -94,50 +102,259 @@ def _send_req_and_email(
                         subject="Powiadomienie o wylaczeniu pradu",
                         body=body,
                         log_dir=log_dir,
+                        timestamp=now,
                     )
                     break
 
+    return (
+        result.error is None
+        and result.status_code is not None
+        and result.status_code < 400
+        and formatted_response is not None
+    )
+
+
+def _now() -> dt.datetime:
+    return dt.datetime.now(tz=WARSAW_TZ)
 
-def run_loop() -> None:
-    config = load_config()
-    session = requests.Session()
-    last_sent: dict[int, dt.date] = {}
 
-    now = dt.datetime.now(tz=WARSAW_TZ)
+def _reload_config(
+    *,
+    watcher: ConfigWatcher,
+    config: AppConfig,
+    now: dt.datetime,
+    log_dir: str,
+) -> AppConfig:
+    try:
+        new_config = watcher.reload()
+    except (OSError, ValueError) as e:
+        write_message(
+            log_dir=log_dir,
+            timestamp=now,
+            level="ERROR",
+            message=f"Config reload failed, keeping current config: {e}",
+        )
+        return config
+
+    changed = changed_fields(config, new_config)
     write_message(
-        log_dir=LOG_DIR,
+        log_dir=log_dir,
         timestamp=now,
         level="INFO",
+        message="Config reloaded. Changed: " + (", ".join(changed) or "(none)"),
+    )
+    return new_config
+
+
+@dataclass
+class LoopState:
+    config: AppConfig
+    session: requests.Session
+    log_dir: str
+    watcher: ConfigWatcher | None = None
+    last_sent: dict[int, dt.date] = field(default_factory=dict)
+
+
+def _run_cycle(state: LoopState, now: dt.datetime) -> Optional[bool]:
+    if state.watcher is not None and state.watcher.changed():
+        state.config = _reload_config(
+            watcher=state.watcher,
+            config=state.config,
+            now=now,
+            log_dir=state.log_dir,
+        )
+
+    fetched: Optional[bool] = None
+    for hour in state.config.hours:
+        if now.hour == hour and state.last_sent.get(hour) != now.date():
+            try:
+                fetched = _send_req_and_email(
+                    config=state.config,
+                    session=state.session,
+                    now=now,
+                    log_dir=state.log_dir,
+                )
+                state.last_sent[hour] = now.date()
+            except Exception as e:
+                fetched = False
+                write_message(
+                    log_dir=state.log_dir,
+                    timestamp=now,
+                    level="ERROR",
+                    message=f"Error during request/email send: {type(e).__name__}: {e}",
+                )
+    return fetched
+
+
+def _build_state(
+    config: AppConfig | None,
+    log_dir: str,
+    env_path: str | None,
+) -> LoopState:
+    watcher: ConfigWatcher | None = None
+    if config is None:
+        watcher = ConfigWatcher(env_path)
+        config = watcher.config
+    return LoopState(
+        config=config,
+        session=requests.Session(),
+        log_dir=log_dir,
+        watcher=watcher,
+    )
+
+
+async def _wait_for_stop(stop: asyncio.Event, seconds: float) -> None:
+    try:
+        await asyncio.wait_for(stop.wait(), timeout=seconds)
+    except asyncio.TimeoutError:
+        pass
+
+
+def _stale_after_seconds(config: AppConfig) -> float:
+    return config.poll_interval_seconds * 2 + config.timeout_seconds + SMTP_TIMEOUT_SECONDS + 60
+
+
+async def _apply_health_listener(
+    listener: HealthServer,
+    config: AppConfig,
+    log_dir: str,
+    now: dt.datetime,
+) -> None:
+    host, port = config.health_host, config.health_port
+    try:
+        changed = await listener.apply(host, port)
+    except OSError as e:
+        write_message(
+            log_dir=log_dir,
+            timestamp=now,
+            level="ERROR",
+            message=f"Health endpoint unavailable on {host}:{port}: {e}",
+        )
+        return
+    if changed:
+        write_message(
+            log_dir=log_dir,
+            timestamp=now,
+            level="INFO",
+            message=f"Health endpoint on {host}:{port}." if port else "Health endpoint disabled.",
+        )
+
+
+async def _check_cycles(
+    state: LoopState,
+    health: HealthState,
+    listener: HealthServer,
+    executor: ThreadPoolExecutor,
+    stop: asyncio.Event,
+    now_fn: Callable[[], dt.datetime],
+    wait_fn: Callable[[asyncio.Event, float], Awaitable[None]],
+) -> None:
+    loop = asyncio.get_running_loop()
+    while not stop.is_set():
+        health.queue_depth += 1
+        try:
+            fetched = await loop.run_in_executor(executor, _run_cycle, state, now_fn())
+        finally:
+            health.queue_depth -= 1
+        health.record_cycle(fetched)
+        health.stale_after_seconds = _stale_after_seconds(state.config)
+        await _apply_health_listener(listener, state.config, state.log_dir, now_fn())
+        await wait_fn(stop, state.config.poll_interval_seconds)
+
+
+def _install_signal_handlers(stop: asyncio.Event) -> None:
+    loop = asyncio.get_running_loop()
+    for signum in (signal.SIGTERM, signal.SIGINT):
+        try:
+            loop.add_signal_handler(signum, stop.set)
+        except (NotImplementedError, RuntimeError):
+            # Not supported on Windows; Ctrl+C still raises KeyboardInterrupt.
+            pass
+
+
+async def run_supervisor(
+    *,
+    config: AppConfig | None = None,
+    now_fn: Callable[[], dt.datetime] = _now,
+    wait_fn: Callable[[asyncio.Event, float], Awaitable[None]] = _wait_for_stop,
+    log_dir: str = LOG_DIR,
+    env_path: str | None = None,
+) -> int:
+    state = _build_state(config, log_dir, env_path)
+    config = state.config
+    health = HealthState(stale_after_seconds=_stale_after_seconds(config))
+    stop = asyncio.Event()
+    _install_signal_handlers(stop)
+
+    executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="check")
+    write_message(
+        log_dir=log_dir,
+        timestamp=now_fn(),
+        level="INFO",
         message="App started.",
     )
+    listener = HealthServer(health)
+    await _apply_health_listener(listener, config, log_dir, now_fn())
 
-    while True:
-        now = dt.datetime.now(tz=WARSAW_TZ)
-        for hour in config.hours:
-            if now.hour == hour and last_sent.get(hour) != now.date():
-                try:
-                    _send_req_and_email(
-                        config=config,
-                        session=session,
-                        now=now,
-                        log_dir=LOG_DIR,
-                    )
-                    last_sent[hour] = now.date()
-                except Exception as e:
-                    write_message(
-                        log_dir=LOG_DIR,
-                        timestamp=now,
-                        level="ERROR",
-                        message=f"Error during request/email send: {type(e).__name__}: {e}",
-                    )
-        time.sleep(config.poll_interval_seconds)
+    cycles = asyncio.create_task(
+        _check_cycles(state, health, listener, executor, stop, now_fn, wait_fn)
+    )
+    stop_wait = asyncio.create_task(stop.wait())
+    await asyncio.wait({cycles, stop_wait}, return_when=asyncio.FIRST_COMPLETED)
+    stop.set()
+    stop_wait.cancel()
+    health.draining = True
+
+    deadline = state.config.shutdown_timeout_seconds
+    write_message(
+        log_dir=log_dir,
+        timestamp=now_fn(),
+        level="INFO",
+        message=f"Shutting down, draining pending work (deadline {deadline}s).",
+    )
+    drained = True
+    exit_code = 0
+    try:
+        await asyncio.wait_for(asyncio.shield(cycles), timeout=deadline)
+    except asyncio.TimeoutError:
+        drained = False
+        exit_code = 1
+    except Exception as e:
+        exit_code = 1
+        write_message(
+            log_dir=log_dir,
+            timestamp=now_fn(),
+            level="ERROR",
+            message=f"Check loop failed: {type(e).__name__}: {e}",
+        )
+
+    await listener.close()
+    executor.shutdown(wait=drained, cancel_futures=True)
+    state.session.close()
+
+    if drained:
+        message = "Shutdown complete."
+    else:
+        message = f"Shutdown deadline exceeded with {health.queue_depth} pending job(s)."
+    write_message(
+        log_dir=log_dir,
+        timestamp=now_fn(),
+        level="INFO" if drained else "ERROR",
+        message=message,
+    )
+    return exit_code
 
 
 def main() -> None:
     try:
-        run_loop()
+        exit_code = asyncio.run(run_supervisor())
     except KeyboardInterrupt:
         return
+    if exit_code:
+        # Skip joining a worker thread that may still be blocked in I/O.
+        sys.stdout.flush()
+        os._exit(exit_code)
+
 
 if __name__ == "__main__":
     main()
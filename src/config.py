@@ -1,10 +1,12 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import List
+from dataclasses import dataclass, fields
+from typing import List, Mapping, Optional, Tuple
 import os
 
-from dotenv import load_dotenv
+from dotenv import dotenv_values, find_dotenv, load_dotenv
+
+from http_client import BASE_URL
 
 
 @dataclass(frozen=True)
@@ -23,6 +25,10 @@ class AppConfig:
     smtp_from: str
     smtp_to: List[str]
     smtp_use_tls: bool
+    api_base_url: str = BASE_URL
+    health_host: str = "127.0.0.1"
+    health_port: int = 8080
+    shutdown_timeout_seconds: int = 8
 
 
 def parse_hours(value: str) -> List[int]:
@@ -43,8 +49,14 @@ def parse_hours(value: str) -> List[int]:
     return hours
 
 
-def _read_int(name: str, default: int, min_value: int, max_value: int) -> int:
-    raw = os.getenv(name)
+def _read_int(
+    env: Mapping[str, str],
+    name: str,
+    default: int,
+    min_value: int,
+    max_value: int,
+) -> int:
+    raw = env.get(name)
     if raw is None or raw == "":
         return default
     if not raw.isdigit():
@@ -55,15 +67,15 @@ def _read_int(name: str, default: int, min_value: int, max_value: int) -> int:
     return value
 
 
-def _read_required(name: str) -> str:
-    raw = os.getenv(name)
+def _read_required(env: Mapping[str, str], name: str) -> str:
+    raw = env.get(name)
     if raw is None or raw.strip() == "":
         raise ValueError(f"{name} is required")
     return raw.strip()
 
 
-def _read_email_list(name: str) -> List[str]:
-    raw = _read_required(name)
+def _read_email_list(env: Mapping[str, str], name: str) -> List[str]:
+    raw = _read_required(env, name)
     parts = [part.strip() for part in raw.split(",")]
     recipients = [part for part in parts if part]
     if not recipients:
@@ -71,8 +83,8 @@ def _read_email_list(name: str) -> List[str]:
     return recipients
 
 
-def _read_bool(name: str, default: bool) -> bool:
-    raw = os.getenv(name)
+def _read_bool(env: Mapping[str, str], name: str, default: bool) -> bool:
+    raw = env.get(name)
     if raw is None or raw.strip() == "":
         return default
     normalized = raw.strip().lower()
@@ -83,34 +95,46 @@ def _read_bool(name: str, default: bool) -> bool:
     raise ValueError(f"{name} must be a boolean")
 
 
-def load_config(env_path: str | None = None) -> AppConfig:
-    load_dotenv(env_path)
+def _read_url(env: Mapping[str, str], name: str, default: str) -> str:
+    raw = env.get(name)
+    if raw is None or raw.strip() == "":
+        return default
+    value = raw.strip()
+    if not value.startswith(("http://", "https://")):
+        raise ValueError(f"{name} must be an http(s) URL")
+    return value
 
-    hours_raw = os.getenv("HOURS")
+
+def config_from_env(env: Mapping[str, str]) -> AppConfig:
+    hours_raw = env.get("HOURS")
     if not hours_raw:
         raise ValueError("HOURS is required")
     hours = parse_hours(hours_raw)
 
-    city_sym = os.getenv("CITY_SYM")
+    city_sym = env.get("CITY_SYM")
     if not city_sym:
         raise ValueError("CITY_SYM is required")
     if not city_sym.isdigit():
         raise ValueError("CITY_SYM must be numeric")
 
-    city_name = _read_required("CITY_NAME")
-
-    poll_interval_seconds = _read_int("POLL_INTERVAL_SECONDS", 30, 1, 3600)
-    timeout_seconds = _read_int("REQUEST_TIMEOUT_SECONDS", 10, 1, 120)
-    interval_days = _read_int("INTERVAL_DAYS", 7, 1, 365)
-    street_name = os.getenv("STREET_NAME", "Ulica")
-
-    smtp_host = _read_required("SMTP_HOST")
-    smtp_port = _read_int("SMTP_PORT", 587, 1, 65535)
-    smtp_user = _read_required("SMTP_USER")
-    smtp_password = _read_required("SMTP_PASSWORD")
-    smtp_from = _read_required("SMTP_FROM")
-    smtp_to = _read_email_list("SMTP_TO")
-    smtp_use_tls = _read_bool("SMTP_USE_TLS", True)
+    city_name = _read_required(env, "CITY_NAME")
+
+    poll_interval_seconds = _read_int(env, "POLL_INTERVAL_SECONDS", 30, 1, 3600)
+    timeout_seconds = _read_int(env, "REQUEST_TIMEOUT_SECONDS", 10, 1, 120)
+    interval_days = _read_int(env, "INTERVAL_DAYS", 7, 1, 365)
+    street_name = env.get("STREET_NAME", "Ulica")
+
+    smtp_host = _read_required(env, "SMTP_HOST")
+    smtp_port = _read_int(env, "SMTP_PORT", 587, 1, 65535)
+    smtp_user = _read_required(env, "SMTP_USER")
+    smtp_password = _read_required(env, "SMTP_PASSWORD")
+    smtp_from = _read_required(env, "SMTP_FROM")
+    smtp_to = _read_email_list(env, "SMTP_TO")
+    smtp_use_tls = _read_bool(env, "SMTP_USE_TLS", True)
+    api_base_url = _read_url(env, "API_BASE_URL", BASE_URL)
+    health_host = env.get("HEALTH_HOST", "").strip() or "127.0.0.1"
+    health_port = _read_int(env, "HEALTH_PORT", 8080, 0, 65535)
+    shutdown_timeout_seconds = _read_int(env, "SHUTDOWN_TIMEOUT_SECONDS", 8, 1, 600)
 
     return AppConfig(
         hours=hours,
@@ -127,4 +151,63 @@ def load_config(env_path: str | None = None) -> AppConfig:
         smtp_from=smtp_from,
         smtp_to=smtp_to,
         smtp_use_tls=smtp_use_tls,
+        api_base_url=api_base_url,
+        health_host=health_host,
+        health_port=health_port,
+        shutdown_timeout_seconds=shutdown_timeout_seconds,
     )
+
+
+def load_config(env_path: str | None = None) -> AppConfig:
+    load_dotenv(env_path)
+    return config_from_env(os.environ)
+
+
+def changed_fields(old: AppConfig, new: AppConfig) -> List[str]:
+    return [
+        item.name
+        for item in fields(AppConfig)
+        if getattr(old, item.name) != getattr(new, item.name)
+    ]
+
+
+class ConfigWatcher:
+    """Polls the .env file mtime and re-validates the config when it changes.
+
+    Values from the process environment keep precedence over the file, the
+    same way ``load_dotenv`` treats them on startup.
+    """
+
+    def __init__(self, env_path: str | None = None) -> None:
+        self.env_path = env_path or find_dotenv() or os.path.join(os.getcwd(), ".env")
+        self._base_env = dict(os.environ)
+        self._stamp = self._read_stamp()
+        self.config = self._load()
+
+    def _read_stamp(self) -> Optional[Tuple[int, int]]:
+        try:
+            stat = os.stat(self.env_path)
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def _load(self) -> AppConfig:
+        env = {
+            key: value
+            for key, value in dotenv_values(self.env_path).items()
+            if value is not None
+        }
+        env.update(self._base_env)
+        return config_from_env(env)
+
+    def changed(self) -> bool:
+        stamp = self._read_stamp()
+        if stamp == self._stamp:
+            return False
+        self._stamp = stamp
+        return True
+
+    def reload(self) -> AppConfig:
+        config = self._load()
+        self.config = config
+        return config
@@ -1,23 +1,43 @@
 from __future__ import annotations
 
 import datetime as dt
+import functools
+import re
 import smtplib
+from dataclasses import dataclass
+from email import policy
 from email.message import EmailMessage
+from typing import Optional, Tuple
 from zoneinfo import ZoneInfo
 
 from response_models import Address, OutageRecord
 from log_writer import write_message
 
 WARSAW_TZ = ZoneInfo("Europe/Warsaw")
+RENDER_CACHE_SIZE = 32
+HEADER_CACHE_SIZE = 64
+BODY_CACHE_SIZE = 16
+SMTP_TIMEOUT_SECONDS = 30
+MAX_8BIT_LINE_BYTES = 998
+MAX_HEADER_VALUE_LENGTH = 72
+_LINE_BREAK_RE = re.compile(r"\r\n|\r|\n")
+
+AddressKey = Tuple[Optional[str], Optional[str]]
+RecordFingerprint = Tuple[str, str, str, bool, Optional[str], Tuple[AddressKey, ...]]
+
+
+@dataclass(frozen=True)
+class RenderedRecord:
+    start_dt: dt.datetime
+    schedule: str
+    details: str
 
 
 def _parse_datetime(value: str) -> dt.datetime:
     return dt.datetime.strptime(value, "%Y-%m-%d %H:%M:%S")
 
 
-def _format_remaining(now: dt.datetime, start_at: str, stop_at: str) -> str:
-    start_dt = _parse_datetime(start_at).replace(tzinfo=WARSAW_TZ)
-
+def _format_remaining_until(now: dt.datetime, start_dt: dt.datetime) -> str:
     if now < start_dt:
         delta = start_dt - now
     else:
@@ -33,48 +53,183 @@ def _format_remaining(now: dt.datetime, start_at: str, stop_at: str) -> str:
     return f"godzin: {hours}, minut: {minutes}"
 
 
-def _format_addresses(addresses: list[Address]) -> str:
-    if not addresses:
+def _address_keys(addresses: list[Address]) -> Tuple[AddressKey, ...]:
+    return tuple(
+        [
+            (
+                address.teryt.street_name if address.teryt is not None else None,
+                address.numbers,
+            )
+            for address in addresses
+        ]
+    )
+
+
+def _format_address_keys(keys: Tuple[AddressKey, ...]) -> str:
+    if not keys:
         return "Brak adresow"
 
     lines: list[str] = []
-    for idx, address in enumerate(addresses, start=1):
-        street_name = None
-        if address.teryt is not None:
-            street_name = address.teryt.street_name
+    for idx, (street_name, numbers) in enumerate(keys, start=1):
         street_label = street_name or "(brak)"
-        numbers = address.numbers or "(brak)"
-        lines.append(f"{idx}) Ulica: {street_label}, numery: {numbers}")
+        numbers_label = numbers or "(brak)"
+        lines.append(f"{idx}) Ulica: {street_label}, numery: {numbers_label}")
 
     return "\n".join(lines)
 
 
+def record_fingerprint(record: OutageRecord) -> RecordFingerprint:
+    return (
+        record.description,
+        record.start_at,
+        record.stop_at,
+        record.revoked,
+        record.revoked_description,
+        _address_keys(record.addresses),
+    )
+
+
+@functools.lru_cache(maxsize=RENDER_CACHE_SIZE)
+def _render_record(fingerprint: RecordFingerprint) -> RenderedRecord:
+    description, start_at, stop_at, revoked, revoked_description, address_keys = fingerprint
+    revoked_label = "Tak" if revoked else "Nie"
+    details = (
+        "Szczegóły przerwy:\n"
+        f"Opis: {description}\n"
+        f"Odwołane: {revoked_label}\n"
+        f"Opis odwołania: {revoked_description or '(brak)'}\n"
+        "Adresy:\n"
+        f"{_format_address_keys(address_keys)}\n\n"
+        "Pozdro,\n"
+        "Admin\n"
+    )
+    return RenderedRecord(
+        start_dt=_parse_datetime(start_at).replace(tzinfo=WARSAW_TZ),
+        schedule=f"Nastąpi ono od {start_at} do {stop_at}.\n",
+        details=details,
+    )
+
+
+def render_record(record: OutageRecord) -> RenderedRecord:
+    return _render_record(record_fingerprint(record))
+
+
+def clear_render_cache() -> None:
+    _render_record.cache_clear()
+    _serialize_common_headers.cache_clear()
+    _serialize_to_header.cache_clear()
+    _encode_body.cache_clear()
+
+
 def build_email_body(
     now: dt.datetime,
     record: OutageRecord,
     city_name: str,
     street_name: str,
 ) -> str:
-    remaining = _format_remaining(now, record.start_at, record.stop_at)
-    addresses = _format_addresses(record.addresses)
-    revoked_label = "Tak" if record.revoked else "Nie"
-    revoked_description = record.revoked_description or "(brak)"
+    rendered = render_record(record)
+    remaining = _format_remaining_until(now, rendered.start_dt)
     return (
         "Cześć,\n\n"
         f"Zbliża się wyłączenie planowe prądu dla {city_name} na Twojej ulicy: {street_name}.\n"
-        f"Nastąpi ono od {record.start_at} do {record.stop_at}.\n"
+        f"{rendered.schedule}"
         f"POZOSTAŁY CZAS: {remaining}.\n\n"
-        "Szczegóły przerwy:\n"
-        f"Opis: {record.description}\n"
-        f"Odwołane: {revoked_label}\n"
-        f"Opis odwołania: {revoked_description}\n"
-        "Adresy:\n"
-        f"{addresses}\n\n"
-        "Pozdro,\n"
-        "Admin\n"
+        f"{rendered.details}"
+    )
+
+
+def _serialize_headers(headers: list[Tuple[str, str]]) -> bytes:
+    message = EmailMessage()
+    for name, value in headers:
+        message[name] = value
+    serialized = message.as_bytes(policy=policy.SMTP)
+    return serialized[: -len(b"\r\n")]
+
+
+@functools.lru_cache(maxsize=HEADER_CACHE_SIZE)
+def _serialize_common_headers(subject: str, sender: str) -> bytes:
+    return _serialize_headers(
+        [
+            ("Subject", subject),
+            ("From", sender),
+            ("Content-Type", 'text/plain; charset="utf-8"'),
+            ("Content-Transfer-Encoding", "8bit"),
+            ("MIME-Version", "1.0"),
+        ]
     )
 
 
+@functools.lru_cache(maxsize=HEADER_CACHE_SIZE)
+def _serialize_to_header(recipients: Tuple[str, ...]) -> bytes:
+    value = ", ".join(recipients)
+    if value.isascii() and value.isprintable() and len(value) <= MAX_HEADER_VALUE_LENGTH:
+        return f"To: {value}\r\n".encode("ascii")
+    return _serialize_headers([("To", value)])
+
+
+def _serialize_fallback(
+    subject: str,
+    sender: str,
+    recipients: Tuple[str, ...],
+    body: str,
+    cte: Optional[str] = None,
+) -> bytes:
+    message = EmailMessage()
+    message["Subject"] = subject
+    message["From"] = sender
+    message["To"] = ", ".join(recipients)
+    message.set_content(body, subtype="plain", charset="utf-8", cte=cte)
+    return message.as_bytes(policy=policy.SMTP)
+
+
+@functools.lru_cache(maxsize=BODY_CACHE_SIZE)
+def _encode_body(body: str) -> Optional[bytes]:
+    if "\r" in body:
+        body = _LINE_BREAK_RE.sub("\n", body)
+    encoded = body.replace("\n", "\r\n").encode("utf-8")
+    if not encoded.endswith(b"\r\n"):
+        encoded += b"\r\n"
+    longest_line = len(encoded)
+    if longest_line > MAX_8BIT_LINE_BYTES:
+        longest_line = max(map(len, encoded.split(b"\r\n")))
+    if longest_line > MAX_8BIT_LINE_BYTES:
+        return None
+    return encoded
+
+
+def _serialize_message(
+    subject: str,
+    sender: str,
+    recipients: Tuple[str, ...],
+    body: str,
+) -> bytes:
+    encoded = _encode_body(body)
+    if encoded is None:
+        return _serialize_fallback(subject, sender, recipients, body)
+    return (
+        _serialize_to_header(recipients)
+        + _serialize_common_headers(subject, sender)
+        + b"\r\n"
+        + encoded
+    )
+
+
+def build_message_bytes(
+    *,
+    subject: str,
+    sender: str,
+    recipients: list[str],
+    body: str,
+    eight_bit: bool = True,
+) -> bytes:
+    if not eight_bit:
+        # Servers without 8BITMIME only accept 7-bit data.
+        return _serialize_fallback(
+            subject, sender, tuple(recipients), body, cte="quoted-printable"
+        )
+    return _serialize_message(subject, sender, tuple(recipients), body)
+
+
 def send_email(
     *,
     host: str,
@@ -87,36 +242,46 @@ def send_email(
     subject: str,
     body: str,
     log_dir: str | None = None,
+    timestamp: dt.datetime | None = None,
 ) -> None:
-    message = EmailMessage()
-    message["Subject"] = subject
-    message["From"] = sender
-    message["To"] = ", ".join(recipients)
-    message.set_content(body, subtype="plain", charset="utf-8")
+    if timestamp is None:
+        timestamp = dt.datetime.now(tz=WARSAW_TZ)
 
-    with smtplib.SMTP(host, port, timeout=30) as client:
+    with smtplib.SMTP(host, port, timeout=SMTP_TIMEOUT_SECONDS) as client:
         if use_tls:
             client.starttls()
-            try:
+        try:
+            client.ehlo_or_helo_if_needed()
+            # Never send credentials over a plaintext connection.
+            if use_tls and username and password and client.has_extn("auth"):
                 client.login(username, password)
-                client.send_message(message)
-                if log_dir is not None:
-                    write_message(
-                        log_dir=log_dir,
-                        timestamp=dt.datetime.now(tz=WARSAW_TZ),
-                        level="INFO",
-                        message="Email sent successfully: "
-                        + subject
-                        + " to "
-                        + ", ".join(recipients)
-                        + "\n"
-                        + body,
-                    )
-            except smtplib.SMTPException as e:
-                if log_dir is not None:
-                    write_message(
-                        log_dir=log_dir,
-                        timestamp=dt.datetime.now(tz=WARSAW_TZ),
-                        level="ERROR",
-                        message="Failed to send email: " + str(e),
-                    )
+            eight_bit = client.has_extn("8bitmime")
+            payload = build_message_bytes(
+                subject=subject,
+                sender=sender,
+                recipients=recipients,
+                body=body,
+                eight_bit=eight_bit,
+            )
+            mail_options = ["BODY=8BITMIME"] if eight_bit else []
+            client.sendmail(sender, recipients, payload, mail_options=mail_options)
+            if log_dir is not None:
+                write_message(
+                    log_dir=log_dir,
+                    timestamp=timestamp,
+                    level="INFO",
+                    message="Email sent successfully: "
+                    + subject
+                    + " to "
+                    + ", ".join(recipients)
+                    + "\n"
+                    + body,
+                )
+        except smtplib.SMTPException as e:
+            if log_dir is not None:
+                write_message(
+                    log_dir=log_dir,
+                    timestamp=timestamp,
+                    level="ERROR",
+                    message="Failed to send email: " + str(e),
+                )
@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass, field
+import json
+import time
+from typing import Any, Dict, Optional, Tuple
+
+
+READ_TIMEOUT_SECONDS = 5
+REASONS = {
+    200: "OK",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    503: "Service Unavailable",
+}
+
+
+@dataclass
+class HealthState:
+    stale_after_seconds: float
+    started_at: float = field(default_factory=time.monotonic)
+    last_cycle_at: Optional[float] = None
+    last_fetch_ok_at: Optional[float] = None
+    last_fetch_failed_at: Optional[float] = None
+    queue_depth: int = 0
+    draining: bool = False
+
+    def record_cycle(self, fetched: Optional[bool]) -> None:
+        now = time.monotonic()
+        self.last_cycle_at = now
+        if fetched is True:
+            self.last_fetch_ok_at = now
+        elif fetched is False:
+            self.last_fetch_failed_at = now
+
+    def is_live(self, now: float) -> bool:
+        reference = self.last_cycle_at if self.last_cycle_at is not None else self.started_at
+        return now - reference <= self.stale_after_seconds
+
+    def is_ready(self, now: float) -> bool:
+        if self.draining or self.last_cycle_at is None or not self.is_live(now):
+            return False
+        if self.last_fetch_failed_at is None:
+            return True
+        return self.last_fetch_ok_at is not None and self.last_fetch_ok_at > self.last_fetch_failed_at
+
+    def snapshot(self, now: float) -> Dict[str, Any]:
+        return {
+            "uptime_seconds": round(now - self.started_at, 1),
+            "last_cycle_age_seconds": _age(now, self.last_cycle_at),
+            "last_successful_fetch_age_seconds": _age(now, self.last_fetch_ok_at),
+            "last_failed_fetch_age_seconds": _age(now, self.last_fetch_failed_at),
+            "queue_depth": self.queue_depth,
+            "draining": self.draining,
+        }
+
+
+def _age(now: float, value: Optional[float]) -> Optional[float]:
+    if value is None:
+        return None
+    return round(now - value, 1)
+
+
+def _route(health: HealthState, method: str, path: str) -> Tuple[int, Dict[str, Any]]:
+    if path not in {"/healthz", "/readyz"}:
+        return 404, {"status": "not found"}
+    if method not in {"GET", "HEAD"}:
+        return 405, {"status": "method not allowed"}
+
+    now = time.monotonic()
+    ok = health.is_live(now) if path == "/healthz" else health.is_ready(now)
+    payload = health.snapshot(now)
+    payload["status"] = "ok" if ok else "unavailable"
+    return (200 if ok else 503), payload
+
+
+async def _handle(
+    health: HealthState,
+    reader: asyncio.StreamReader,
+    writer: asyncio.StreamWriter,
+) -> None:
+    try:
+        request_line = await asyncio.wait_for(reader.readline(), READ_TIMEOUT_SECONDS)
+        while True:
+            header = await asyncio.wait_for(reader.readline(), READ_TIMEOUT_SECONDS)
+            if header in {b"", b"\r\n", b"\n"}:
+                break
+
+        parts = request_line.decode("latin-1").split()
+        if len(parts) < 2:
+            return
+        method = parts[0].upper()
+        path = parts[1].split("?", 1)[0]
+        status, payload = _route(health, method, path)
+
+        body = json.dumps(payload).encode("utf-8")
+        head = (
+            f"HTTP/1.1 {status} {REASONS[status]}\r\n"
+            "Content-Type: application/json\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            "Connection: close\r\n"
+            "\r\n"
+        ).encode("ascii")
+        writer.write(head if method == "HEAD" else head + body)
+        await writer.drain()
+    except (asyncio.TimeoutError, ConnectionError, ValueError):
+        pass
+    finally:
+        writer.close()
+
+
+class HealthServer:
+    def __init__(self, health: HealthState) -> None:
+        self.health = health
+        self.address: Optional[Tuple[str, int]] = None
+        self._server: Optional[asyncio.Server] = None
+
+    async def apply(self, host: str, port: int) -> bool:
+        if self.address == (host, port):
+            return False
+        await self.close()
+        self.address = None
+        if port != 0:
+            self._server = await asyncio.start_server(
+                lambda reader, writer: _handle(self.health, reader, writer),
+                host,
+                port,
+            )
+        # Only remember the address once bound, so a failed bind is retried.
+        self.address = (host, port)
+        return True
+
+    async def close(self) -> None:
+        if self._server is None:
+            return
+        self._server.close()
+        await self._server.wait_closed()
+        self._server = None
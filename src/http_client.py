@@ -46,8 +46,8 @@ def build_params(now: dt.datetime, city_sym: str, interval_days: int) -> Dict[st
     }
 
 
-def build_request_url(params: Dict[str, Any]) -> str:
-    request = requests.Request("GET", BASE_URL, params=params)
+def build_request_url(params: Dict[str, Any], base_url: str = BASE_URL) -> str:
+    request = requests.Request("GET", base_url, params=params)
     prepared = request.prepare()
     if not prepared.url:
         raise ValueError("Failed to build request URL")
@@ -60,12 +60,13 @@ def send_request(
     city_sym: str,
     interval_days: int,
     timeout_seconds: int,
+    base_url: str = BASE_URL,
 ) -> RequestResult:
     params = build_params(now, city_sym, interval_days)
-    url = build_request_url(params)
+    url = build_request_url(params, base_url)
     try:
         response = session.get(
-            BASE_URL,
+            base_url,
             params=params,
             headers=DEFAULT_HEADERS,
             timeout=timeout_seconds,
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import asyncio
+import os
+import signal
+import threading
+from pathlib import Path
+from typing import Optional
+
+import pytest
+
+import app
+from config import AppConfig
+
+
+def _config(shutdown_timeout_seconds: int) -> AppConfig:
+    return AppConfig(
+        hours=[9],
+        city_sym="0031377",
+        city_name="Białystok",
+        poll_interval_seconds=60,
+        timeout_seconds=10,
+        interval_days=3,
+        street_name="Zdrojowa",
+        smtp_host="127.0.0.1",
+        smtp_port=25,
+        smtp_user="user",
+        smtp_password="secret",
+        smtp_from="alerts@example.com",
+        smtp_to=["a@example.com"],
+        smtp_use_tls=False,
+        api_base_url="http://127.0.0.1:9/api",
+        health_port=0,
+        shutdown_timeout_seconds=shutdown_timeout_seconds,
+    )
+
+
+def _run_with_sigterm(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+    *,
+    cycle_seconds: float,
+    shutdown_timeout_seconds: int,
+) -> int:
+    started = threading.Event()
+    release = threading.Event()
+
+    def slow_cycle(state: app.LoopState, now: object) -> Optional[bool]:
+        started.set()
+        release.wait(cycle_seconds)
+        return True
+
+    monkeypatch.setattr(app, "_run_cycle", slow_cycle)
+
+    async def scenario() -> int:
+        supervisor = asyncio.create_task(
+            app.run_supervisor(
+                config=_config(shutdown_timeout_seconds),
+                log_dir=str(tmp_path),
+            )
+        )
+        await asyncio.get_running_loop().run_in_executor(None, started.wait, 5)
+        os.kill(os.getpid(), signal.SIGTERM)
+        return await supervisor
+
+    try:
+        return asyncio.run(scenario())
+    finally:
+        release.set()
+
+
+def _read_logs(log_dir: Path) -> str:
+    return "".join(path.read_text(encoding="utf-8") for path in log_dir.iterdir())
+
+
+def test_sigterm_drains_in_flight_cycle(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    exit_code = _run_with_sigterm(
+        monkeypatch,
+        tmp_path,
+        cycle_seconds=0.3,
+        shutdown_timeout_seconds=2,
+    )
+
+    assert exit_code == 0
+    assert "Shutdown complete." in _read_logs(tmp_path)
+
+
+def test_sigterm_past_deadline_exits_with_error(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    exit_code = _run_with_sigterm(
+        monkeypatch,
+        tmp_path,
+        cycle_seconds=5,
+        shutdown_timeout_seconds=1,
+    )
+
+    assert exit_code == 1
+    assert "Shutdown deadline exceeded with 1 pending job(s)." in _read_logs(tmp_path)
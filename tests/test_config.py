@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import datetime as dt
+import os
+from pathlib import Path
+
+import pytest
+
+from app import WARSAW_TZ, _reload_config
+from config import ConfigWatcher
+
+
+ENV_KEYS = [
+    "HOURS",
+    "CITY_SYM",
+    "CITY_NAME",
+    "STREET_NAME",
+    "POLL_INTERVAL_SECONDS",
+    "SMTP_HOST",
+    "SMTP_USER",
+    "SMTP_PASSWORD",
+    "SMTP_FROM",
+    "SMTP_TO",
+]
+BASE_ENV = {
+    "HOURS": "09,21",
+    "CITY_SYM": "0031377",
+    "CITY_NAME": "Białystok",
+    "STREET_NAME": "Zdrojowa",
+    "SMTP_HOST": "smtp.example.com",
+    "SMTP_USER": "user",
+    "SMTP_PASSWORD": "secret",
+    "SMTP_FROM": "alerts@example.com",
+    "SMTP_TO": "a@example.com",
+}
+NOW = dt.datetime(2026, 10, 19, 9, 30, tzinfo=WARSAW_TZ)
+
+
+@pytest.fixture(autouse=True)
+def _clean_env(monkeypatch: pytest.MonkeyPatch) -> None:
+    for key in ENV_KEYS:
+        monkeypatch.delenv(key, raising=False)
+
+
+def _write_env(path: Path, **overrides: str) -> None:
+    values = {**BASE_ENV, **overrides}
+    previous = path.stat().st_mtime_ns if path.exists() else 0
+    path.write_text("".join(f"{key}={value}\n" for key, value in values.items()), encoding="utf-8")
+    # Bump the mtime explicitly so the change is seen on coarse-grained filesystems.
+    os.utime(path, ns=(previous + 1_000_000_000, previous + 1_000_000_000))
+
+
+def _read_logs(log_dir: Path) -> str:
+    return "".join(path.read_text(encoding="utf-8") for path in log_dir.iterdir())
+
+
+def test_valid_change_is_reloaded(tmp_path: Path) -> None:
+    env_path = tmp_path / ".env"
+    _write_env(env_path)
+    watcher = ConfigWatcher(str(env_path))
+    assert not watcher.changed()
+
+    _write_env(env_path, HOURS="08,21", STREET_NAME="Lipowa")
+    assert watcher.changed()
+    config = _reload_config(
+        watcher=watcher,
+        config=watcher.config,
+        now=NOW,
+        log_dir=str(tmp_path / "logs"),
+    )
+
+    assert config.hours == [8, 21]
+    assert config.street_name == "Lipowa"
+    assert watcher.config is config
+    assert "Changed: hours, street_name" in _read_logs(tmp_path / "logs")
+
+
+def test_invalid_hours_keep_running_config(tmp_path: Path) -> None:
+    env_path = tmp_path / ".env"
+    _write_env(env_path)
+    watcher = ConfigWatcher(str(env_path))
+    running = watcher.config
+
+    _write_env(env_path, HOURS="09,99")
+    assert watcher.changed()
+    config = _reload_config(
+        watcher=watcher,
+        config=running,
+        now=NOW,
+        log_dir=str(tmp_path / "logs"),
+    )
+
+    assert config is running
+    assert watcher.config is running
+    assert config.hours == [9, 21]
+    logs = _read_logs(tmp_path / "logs")
+    assert "[ERROR]" in logs
+    assert "Hour out of range: 99" in logs
+    assert not watcher.changed()
+
+
+def test_deleted_file_keeps_running_config(tmp_path: Path) -> None:
+    env_path = tmp_path / ".env"
+    _write_env(env_path)
+    watcher = ConfigWatcher(str(env_path))
+    running = watcher.config
+
+    env_path.unlink()
+    assert watcher.changed()
+    config = _reload_config(
+        watcher=watcher,
+        config=running,
+        now=NOW,
+        log_dir=str(tmp_path / "logs"),
+    )
+
+    assert config is running
+    assert "Config reload failed" in _read_logs(tmp_path / "logs")
+
+
+def test_process_env_takes_precedence_over_file(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv("STREET_NAME", "Procesowa")
+    env_path = tmp_path / ".env"
+    _write_env(env_path)
+    watcher = ConfigWatcher(str(env_path))
+    assert watcher.config.street_name == "Procesowa"
+
+    _write_env(env_path, STREET_NAME="Lipowa", HOURS="10")
+    assert watcher.changed()
+    config = watcher.reload()
+
+    assert config.street_name == "Procesowa"
+    assert config.hours == [10]
@@ -0,0 +1,193 @@
+from __future__ import annotations
+
+import datetime as dt
+import email
+from email import policy
+
+import pytest
+
+from emailer import (
+    WARSAW_TZ,
+    _encode_body,
+    _serialize_fallback,
+    build_email_body,
+    build_message_bytes,
+    clear_render_cache,
+)
+from response_models import Address, AddressTeryt, OutageRecord
+
+
+SUBJECT = "Powiadomienie o wyłączeniu prądu"
+SENDER = "alerts@example.com"
+
+
+@pytest.fixture(autouse=True)
+def _clear_caches() -> None:
+    clear_render_cache()
+
+
+def _record() -> OutageRecord:
+    return OutageRecord(
+        description="Prace sieciowe",
+        start_at="2026-10-20 08:00:00",
+        stop_at="2026-10-20 16:00:00",
+        revoked=False,
+        revoked_description=None,
+        addresses=[
+            Address(numbers="1, 2A", teryt=AddressTeryt(street_name="Żółkiewskiego")),
+            Address(numbers=None, teryt=None),
+        ],
+    )
+
+
+def _body() -> str:
+    now = dt.datetime(2026, 10, 19, 21, 0, tzinfo=WARSAW_TZ)
+    return build_email_body(now, _record(), "Białystok", "Żółkiewskiego")
+
+
+def _parse(data: bytes) -> email.message.EmailMessage:
+    return email.message_from_bytes(data, policy=policy.default)
+
+
+def test_fast_path_matches_email_message_fallback() -> None:
+    body = _body()
+    recipients = [f"subscriber{idx}@example.com" for idx in range(6)]
+
+    fast = _parse(
+        build_message_bytes(subject=SUBJECT, sender=SENDER, recipients=recipients, body=body)
+    )
+    fallback = _parse(_serialize_fallback(SUBJECT, SENDER, tuple(recipients), body))
+
+    assert fast.get_content().replace("\r\n", "\n") == body
+    assert fast.get_content().replace("\r\n", "\n") == fallback.get_content().replace("\r\n", "\n")
+    assert [a.addr_spec for a in fast["To"].addresses] == recipients
+    assert [a.addr_spec for a in fast["To"].addresses] == [
+        a.addr_spec for a in fallback["To"].addresses
+    ]
+    assert str(fast["Subject"]) == SUBJECT == str(fallback["Subject"])
+    assert str(fast["From"]) == SENDER
+
+
+def test_encoded_body_is_reused_across_recipients() -> None:
+    body = _body()
+
+    first = build_message_bytes(subject=SUBJECT, sender=SENDER, recipients=["a@b.pl"], body=body)
+    second = build_message_bytes(subject=SUBJECT, sender=SENDER, recipients=["c@d.pl"], body=body)
+
+    info = _encode_body.cache_info()
+    assert (info.hits, info.misses) == (1, 1)
+    assert first.split(b"\r\n\r\n", 1)[1] == second.split(b"\r\n\r\n", 1)[1]
+    assert _parse(second)["To"].addresses[0].addr_spec == "c@d.pl"
+
+
+def test_long_lines_use_fallback_encoding() -> None:
+    body = "a" * 2000 + "\n"
+
+    message = _parse(
+        build_message_bytes(subject=SUBJECT, sender=SENDER, recipients=["a@b.pl"], body=body)
+    )
+
+    assert message["Content-Transfer-Encoding"] != "8bit"
+    assert message.get_content().replace("\r\n", "\n") == body
+
+
+class _FakeSmtp:
+    instances: list["_FakeSmtp"] = []
+    extensions: set[str] = {"auth", "8bitmime"}
+
+    def __init__(self, host: str, port: int, timeout: float) -> None:
+        self.calls: list[str] = []
+        self.payload = b""
+        self.mail_options: list[str] = []
+        _FakeSmtp.instances.append(self)
+
+    def __enter__(self) -> "_FakeSmtp":
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        return None
+
+    def starttls(self) -> None:
+        self.calls.append("starttls")
+
+    def ehlo_or_helo_if_needed(self) -> None:
+        self.calls.append("ehlo")
+
+    def has_extn(self, name: str) -> bool:
+        return name in self.extensions
+
+    def login(self, username: str, password: str) -> None:
+        self.calls.append("login")
+
+    def sendmail(
+        self,
+        sender: str,
+        recipients: list[str],
+        payload: bytes,
+        mail_options: tuple[str, ...] | list[str] = (),
+    ) -> None:
+        self.calls.append("sendmail")
+        self.payload = payload
+        self.mail_options = list(mail_options)
+
+
+def _send(
+    monkeypatch: pytest.MonkeyPatch,
+    *,
+    use_tls: bool,
+    extensions: set[str],
+) -> _FakeSmtp:
+    import emailer
+
+    _FakeSmtp.instances = []
+    monkeypatch.setattr(emailer.smtplib, "SMTP", _FakeSmtp)
+    monkeypatch.setattr(_FakeSmtp, "extensions", extensions)
+    emailer.send_email(
+        host="smtp.example.com",
+        port=587,
+        username="user",
+        password="secret",
+        sender=SENDER,
+        recipients=["a@b.pl"],
+        use_tls=use_tls,
+        subject=SUBJECT,
+        body=_body(),
+    )
+    return _FakeSmtp.instances[0]
+
+
+def test_send_email_logs_in_over_tls_when_auth_is_advertised(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    client = _send(monkeypatch, use_tls=True, extensions={"auth", "8bitmime"})
+
+    assert client.calls == ["starttls", "ehlo", "login", "sendmail"]
+
+
+def test_send_email_skips_login_without_auth_extension(monkeypatch: pytest.MonkeyPatch) -> None:
+    client = _send(monkeypatch, use_tls=True, extensions={"8bitmime"})
+
+    assert client.calls == ["starttls", "ehlo", "sendmail"]
+
+
+def test_send_email_never_logs_in_without_tls(monkeypatch: pytest.MonkeyPatch) -> None:
+    client = _send(monkeypatch, use_tls=False, extensions={"auth", "8bitmime"})
+
+    assert client.calls == ["ehlo", "sendmail"]
+
+
+def test_send_email_declares_8bitmime_when_advertised(monkeypatch: pytest.MonkeyPatch) -> None:
+    client = _send(monkeypatch, use_tls=True, extensions={"auth", "8bitmime"})
+
+    assert client.mail_options == ["BODY=8BITMIME"]
+    assert _parse(client.payload)["Content-Transfer-Encoding"] == "8bit"
+
+
+def test_send_email_uses_7bit_body_without_8bitmime(monkeypatch: pytest.MonkeyPatch) -> None:
+    client = _send(monkeypatch, use_tls=True, extensions={"auth"})
+
+    assert client.mail_options == []
+    assert client.payload.isascii()
+    message = _parse(client.payload)
+    assert message["Content-Transfer-Encoding"] == "quoted-printable"
+    assert message.get_content().replace("\r\n", "\n") == _body()
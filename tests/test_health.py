@@ -0,0 +1,180 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import socket
+
+import pytest
+
+import health
+from health import HealthServer, HealthState, _route
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.value = 1000.0
+
+    def __call__(self) -> float:
+        return self.value
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> _Clock:
+    fake = _Clock()
+    monkeypatch.setattr(health.time, "monotonic", fake)
+    return fake
+
+
+@pytest.fixture
+def state(clock: _Clock) -> HealthState:
+    return HealthState(stale_after_seconds=100)
+
+
+def test_before_first_cycle_is_live_but_not_ready(clock: _Clock, state: HealthState) -> None:
+    clock.value += 10
+
+    assert state.is_live(clock())
+    assert not state.is_ready(clock())
+    assert _route(state, "GET", "/healthz")[0] == 200
+    status, payload = _route(state, "GET", "/readyz")
+    assert status == 503
+    assert payload["status"] == "unavailable"
+    assert payload["last_successful_fetch_age_seconds"] is None
+
+
+def test_cycle_without_fetch_is_ready(clock: _Clock, state: HealthState) -> None:
+    state.record_cycle(None)
+
+    assert state.is_ready(clock())
+
+
+def test_failed_fetch_is_not_ready(clock: _Clock, state: HealthState) -> None:
+    state.record_cycle(False)
+    clock.value += 5
+
+    assert state.is_live(clock())
+    assert not state.is_ready(clock())
+    status, payload = _route(state, "GET", "/readyz")
+    assert status == 503
+    assert payload["last_failed_fetch_age_seconds"] == 5.0
+
+
+def test_later_successful_fetch_is_ready_again(clock: _Clock, state: HealthState) -> None:
+    state.record_cycle(False)
+    clock.value += 30
+    state.record_cycle(True)
+    clock.value += 2
+    state.queue_depth = 1
+
+    assert state.is_ready(clock())
+    status, payload = _route(state, "GET", "/readyz")
+    assert status == 200
+    assert payload["status"] == "ok"
+    assert payload["last_successful_fetch_age_seconds"] == 2.0
+    assert payload["queue_depth"] == 1
+
+
+def test_draining_is_live_but_not_ready(clock: _Clock, state: HealthState) -> None:
+    state.record_cycle(True)
+    state.draining = True
+
+    assert _route(state, "GET", "/healthz")[0] == 200
+    status, payload = _route(state, "GET", "/readyz")
+    assert status == 503
+    assert payload["draining"] is True
+
+
+def test_stale_cycle_fails_liveness_and_readiness(clock: _Clock, state: HealthState) -> None:
+    state.record_cycle(True)
+    clock.value += 100
+    assert state.is_live(clock())
+
+    clock.value += 1
+    assert not state.is_live(clock())
+    assert not state.is_ready(clock())
+    assert _route(state, "GET", "/healthz")[0] == 503
+    assert _route(state, "GET", "/readyz")[0] == 503
+
+
+def test_unknown_path_and_method(state: HealthState) -> None:
+    assert _route(state, "GET", "/metrics") == (404, {"status": "not found"})
+    assert _route(state, "POST", "/healthz") == (405, {"status": "method not allowed"})
+    assert _route(state, "HEAD", "/healthz")[0] == 200
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+async def _request(port: int, method: str, path: str) -> bytes:
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    writer.write(f"{method} {path} HTTP/1.1\r\nHost: localhost\r\n\r\n".encode("ascii"))
+    await writer.drain()
+    response = await reader.read()
+    writer.close()
+    return response
+
+
+def test_health_server_serves_http() -> None:
+    async def scenario() -> tuple[bytes, bytes, bytes]:
+        state = HealthState(stale_after_seconds=100)
+        state.record_cycle(True)
+        server = HealthServer(state)
+        port = _free_port()
+        assert await server.apply("127.0.0.1", port)
+        try:
+            return (
+                await _request(port, "GET", "/healthz"),
+                await _request(port, "HEAD", "/readyz"),
+                await _request(port, "GET", "/missing"),
+            )
+        finally:
+            await server.close()
+
+    get, head, missing = asyncio.run(scenario())
+
+    head_part, body = get.split(b"\r\n\r\n", 1)
+    assert head_part.startswith(b"HTTP/1.1 200 OK\r\n")
+    assert f"Content-Length: {len(body)}".encode("ascii") in head_part
+    assert json.loads(body)["status"] == "ok"
+
+    head_headers, head_body = head.split(b"\r\n\r\n", 1)
+    assert head_headers.startswith(b"HTTP/1.1 200 OK\r\n")
+    assert b"Content-Length: " in head_headers
+    assert head_body == b""
+
+    assert missing.startswith(b"HTTP/1.1 404 Not Found\r\n")
+
+
+def test_health_server_retries_failed_bind() -> None:
+    async def scenario() -> None:
+        server = HealthServer(HealthState(stale_after_seconds=100))
+        blocker = socket.socket()
+        blocker.bind(("127.0.0.1", 0))
+        blocker.listen()
+        port = blocker.getsockname()[1]
+        try:
+            with pytest.raises(OSError):
+                await server.apply("127.0.0.1", port)
+            assert server.address is None
+        finally:
+            blocker.close()
+
+        assert await server.apply("127.0.0.1", port)
+        assert server.address == ("127.0.0.1", port)
+        assert not await server.apply("127.0.0.1", port)
+        await server.close()
+
+    asyncio.run(scenario())
+
+
+def test_health_server_port_zero_disables_listener() -> None:
+    async def scenario() -> None:
+        server = HealthServer(HealthState(stale_after_seconds=100))
+        assert await server.apply("127.0.0.1", 0)
+        assert server.address == ("127.0.0.1", 0)
+        assert not await server.apply("127.0.0.1", 0)
+
+    asyncio.run(scenario())